@@ -4,24 +4,31 @@ from __future__ import annotations
 
 import logging
 
+_LEVEL_COLORS = {
+    logging.DEBUG: "\033[36m",  # Cyan
+    logging.INFO: "\033[32m",  # Green
+    logging.WARNING: "\033[33m",  # Yellow
+    logging.ERROR: "\033[31m",  # Red
+    logging.CRITICAL: "\033[35m",  # Magenta
+}
+_RESET = "\033[0m"
+
 
 class _LevelColorFormatter(logging.Formatter):
     """Formatter that colors the level name and omits timestamps."""
 
-    _LEVEL_COLORS = {
-        logging.DEBUG: "\033[36m",  # Cyan
-        logging.INFO: "\033[32m",  # Green
-        logging.WARNING: "\033[33m",  # Yellow
-        logging.ERROR: "\033[31m",  # Red
-        logging.CRITICAL: "\033[35m",  # Magenta
+    _COLORED_LEVELNAMES = {
+        level: f"{color}{logging.getLevelName(level)}{_RESET}"
+        for level, color in _LEVEL_COLORS.items()
     }
-    _RESET = "\033[0m"
 
     def format(self, record: logging.LogRecord) -> str:
+        colored_levelname = self._COLORED_LEVELNAMES.get(record.levelno)
+        if colored_levelname is None:
+            return super().format(record)
+
         original_levelname = record.levelname
-        color_prefix = self._LEVEL_COLORS.get(record.levelno, "")
-        if color_prefix:
-            record.levelname = f"{color_prefix}{record.levelname}{self._RESET}"
+        record.levelname = colored_levelname
         try:
             return super().format(record)
         finally:
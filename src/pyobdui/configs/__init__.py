@@ -1,6 +1,6 @@
 """Configuration utilities for pyOBDui."""
 
-from .constants import CONFIG_SUFFIX, DEFAULT_SUPPORTED_PIDS
+from .constants import CONFIG_INDEX_NAME, CONFIG_SUFFIX, DEFAULT_SUPPORTED_PIDS
 from .models import CarConfig
 from .service import ConfigDetectionError, ConfigError, ConfigNotFoundError, ConfigService
 
@@ -11,5 +11,6 @@ __all__ = [
     "ConfigNotFoundError",
     "ConfigDetectionError",
     "CONFIG_SUFFIX",
+    "CONFIG_INDEX_NAME",
     "DEFAULT_SUPPORTED_PIDS",
 ]
@@ -1,12 +1,14 @@
 """Constants for configuration handling."""
 
 CONFIG_SUFFIX = ".json"
-DEFAULT_SUPPORTED_PIDS = [
-    "SPEED",
-    "RPM",
+# Combined cache of every valid config, keyed by file name and mtime.
+CONFIG_INDEX_NAME = "_index.json"
+DEFAULT_SUPPORTED_PIDS = (
     "COOLANT_TEMP",
-    "INTAKE_TEMP",
-    "THROTTLE_POS",
     "FUEL_LEVEL",
+    "INTAKE_TEMP",
     "MAF",
-]
+    "RPM",
+    "SPEED",
+    "THROTTLE_POS",
+)
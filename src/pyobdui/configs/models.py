@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field  # type: ignore[import]
+from pydantic import BaseModel, ConfigDict, Field, field_validator  # type: ignore[import]
 
 
 class CarConfig(BaseModel):
@@ -15,9 +15,9 @@ class CarConfig(BaseModel):
     name: str = Field(..., description="Human-friendly name for the vehicle")
     adapter_port: str = Field(..., description="Serial/Bluetooth port for the adapter")
     database_path: Path = Field(..., description="Path to the vehicle's SQLite database")
-    supported_pids: List[str] = Field(
-        default_factory=list,
-        description="OBD PIDs that are known to work for this vehicle",
+    supported_pids: Tuple[str, ...] = Field(
+        default_factory=tuple,
+        description="OBD PIDs that are known to work for this vehicle, kept sorted",
     )
     polling_interval: float = Field(
         default=1.0,
@@ -37,9 +37,19 @@ class CarConfig(BaseModel):
         arbitrary_types_allowed=True,
         populate_by_name=True,
         use_enum_values=True,
+        validate_assignment=True,
     )
 
-    def sorted_pids(self) -> List[str]:
-        """Return a sorted copy of supported PIDs for convenience."""
+    @field_validator("supported_pids")
+    @classmethod
+    def _sort_pids(cls, value: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(sorted(value))
 
-        return sorted(self.supported_pids)
+    def sorted_pids(self) -> Tuple[str, ...]:
+        """Return the supported PIDs sorted.
+
+        The field is an immutable tuple that is sorted on validation and on assignment, so the
+        same object is returned until ``supported_pids`` is replaced.
+        """
+
+        return self.supported_pids
@@ -4,16 +4,34 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Mapping
+from typing import Dict, Iterable, List, Mapping, Tuple
 
-from pydantic import ValidationError  # type: ignore[import]
+from pydantic import BaseModel, TypeAdapter, ValidationError  # type: ignore[import]
 
-from .constants import CONFIG_SUFFIX, DEFAULT_SUPPORTED_PIDS  # type: ignore[import]
+from .constants import (  # type: ignore[import]
+    CONFIG_INDEX_NAME,
+    CONFIG_SUFFIX,
+    DEFAULT_SUPPORTED_PIDS,
+)
 from .models import CarConfig
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
+class _IndexEntry(BaseModel):
+    """A parsed config together with the file name and mtime it was read from."""
+
+    file: str
+    mtime_ns: int
+    config: CarConfig
+
+
+_INDEX_ADAPTER = TypeAdapter(List[_IndexEntry])
+
 
 class ConfigError(RuntimeError):
     """Base exception for configuration operations."""
@@ -35,6 +53,9 @@ class ConfigService:
     def __init__(self, config_dir: Path, database_root: Path) -> None:
         self._config_dir = config_dir
         self._database_root = database_root
+        self._cache: Dict[Path, Tuple[int, CarConfig]] = {}
+        # mtimes of files that failed validation, so they do not force an index reload.
+        self._invalid: Dict[Path, int] = {}
         self._config_dir.mkdir(parents=True, exist_ok=True)
         self._database_root.mkdir(parents=True, exist_ok=True)
 
@@ -44,12 +65,41 @@ class ConfigService:
     def list_configs(self) -> List[CarConfig]:
         """Enumerate available configurations sorted by name."""
 
+        with os.scandir(self._config_dir) as it:
+            mtimes = {
+                Path(entry.path): entry.stat().st_mtime_ns
+                for entry in it
+                if entry.is_file()
+                and entry.name.endswith(CONFIG_SUFFIX)
+                and entry.name != CONFIG_INDEX_NAME
+            }
+        for stale in self._cache.keys() - mtimes.keys():
+            del self._cache[stale]
+        for stale in self._invalid.keys() - mtimes.keys():
+            del self._invalid[stale]
+
+        stale_mtimes = {
+            path: mtime_ns
+            for path, mtime_ns in mtimes.items()
+            if not self._is_cached(path, mtime_ns) and self._invalid.get(path) != mtime_ns
+        }
+        indexed: Dict[str, int] | None = None
+        if stale_mtimes:
+            indexed = self._load_index(stale_mtimes)
+
         configs: List[CarConfig] = []
-        for path in sorted(self._config_dir.glob(f"*{CONFIG_SUFFIX}")):
+        for path, mtime_ns in mtimes.items():
             try:
-                configs.append(CarConfig.model_validate_json(path.read_text()))
+                configs.append(self._read_config(path, mtime_ns))
             except ValidationError as exc:
+                self._invalid[path] = mtime_ns
                 self._logger.warning("Skipping invalid config %s: %s", path.name, exc)
+
+        if indexed is not None:
+            current = {path.name: self._cache[path][0] for path in mtimes if path in self._cache}
+            if current != indexed:
+                self._write_index(mtimes)
+
         configs.sort(key=lambda cfg: cfg.name.lower())
         return configs
 
@@ -65,7 +115,7 @@ class ConfigService:
         if not path.exists():
             raise ConfigNotFoundError(f"Configuration '{name}' does not exist")
         try:
-            return CarConfig.model_validate_json(path.read_text())
+            return self._read_config(path)
         except ValidationError as exc:
             raise ConfigError(f"Configuration '{name}' is invalid: {exc}") from exc
 
@@ -73,6 +123,8 @@ class ConfigService:
         """Persist a configuration definition."""
 
         path = self._config_path_for_name(config.name)
+        self._cache.pop(path, None)
+        self._invalidate_index()
         data = config.model_dump(mode="json")
         path.write_text(json.dumps(data, indent=2, sort_keys=True))
         self._logger.info("Saved configuration '%s' to %s", config.name, path)
@@ -81,6 +133,8 @@ class ConfigService:
         """Delete a configuration if it exists."""
 
         path = self._config_path_for_name(name)
+        self._cache.pop(path, None)
+        self._invalidate_index()
         if path.exists():
             path.unlink()
             self._logger.info("Deleted configuration '%s'", name)
@@ -111,7 +165,7 @@ class ConfigService:
             name=name,
             adapter_port=adapter_port,
             database_path=self._database_path_for_name(name),
-            supported_pids=supported_pids,
+            supported_pids=tuple(supported_pids),
             polling_interval=polling_interval,
             metadata=dict(metadata or {}),
             created_at=datetime.now(timezone.utc),
@@ -150,7 +204,7 @@ class ConfigService:
             if not commands:
                 raise ConfigDetectionError("Adapter did not report supported commands")
 
-            names = sorted({cmd.name for cmd in commands if getattr(cmd, "name", None)})
+            names = sorted({name for cmd in commands if (name := getattr(cmd, "name", None))})
             if not names:
                 self._logger.warning("Adapter returned an empty command list; using defaults")
                 return self.default_supported_pids()
@@ -167,6 +221,56 @@ class ConfigService:
 
         return list(DEFAULT_SUPPORTED_PIDS)
 
+    def _is_cached(self, path: Path, mtime_ns: int) -> bool:
+        cached = self._cache.get(path)
+        return cached is not None and cached[0] == mtime_ns
+
+    def _read_config(self, path: Path, mtime_ns: int | None = None) -> CarConfig:
+        if mtime_ns is None:
+            mtime_ns = path.stat().st_mtime_ns
+        if self._is_cached(path, mtime_ns):
+            return self._cache[path][1]
+
+        config = CarConfig.model_validate_json(path.read_bytes())
+        self._cache[path] = (mtime_ns, config)
+        return config
+
+    def _load_index(self, stale_mtimes: Mapping[Path, int]) -> Dict[str, int]:
+        """Seed the cache from the combined index and return the ``file -> mtime`` it records.
+
+        Only entries whose recorded mtime still matches the file on disk are used.
+        """
+
+        index_path = self._config_dir / CONFIG_INDEX_NAME
+        try:
+            entries = _INDEX_ADAPTER.validate_json(index_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValidationError) as exc:
+            self._logger.debug("Ignoring unreadable config index %s: %s", index_path, exc)
+            return {}
+
+        for entry in entries:
+            path = self._config_dir / entry.file
+            if stale_mtimes.get(path) == entry.mtime_ns:
+                self._cache[path] = (entry.mtime_ns, entry.config)
+        return {entry.file: entry.mtime_ns for entry in entries}
+
+    def _write_index(self, mtimes: Mapping[Path, int]) -> None:
+        entries = [
+            _IndexEntry(file=path.name, mtime_ns=cached[0], config=cached[1])
+            for path in mtimes
+            if (cached := self._cache.get(path)) is not None
+        ]
+        index_path = self._config_dir / CONFIG_INDEX_NAME
+        try:
+            index_path.write_bytes(_INDEX_ADAPTER.dump_json(entries))
+        except OSError as exc:
+            self._logger.debug("Unable to write config index %s: %s", index_path, exc)
+
+    def _invalidate_index(self) -> None:
+        (self._config_dir / CONFIG_INDEX_NAME).unlink(missing_ok=True)
+
     def _config_path_for_name(self, name: str) -> Path:
         slug = self._slugify(name)
         return self._config_dir / f"{slug}{CONFIG_SUFFIX}"
@@ -177,6 +281,5 @@ class ConfigService:
 
     @staticmethod
     def _slugify(name: str) -> str:
-        slug = re.sub(r"[^a-zA-Z0-9]+", "-", name.strip().lower())
-        slug = slug.strip("-")
+        slug = _SLUG_RE.sub("-", name.strip().lower()).strip("-")
         return slug or "vehicle"
@@ -1,6 +1,12 @@
 """Database persistence layer for pyOBDui."""
 
-from .constants import DTC_HISTORY, DTC_INSERT, TELEMETRY_INSERT, TELEMETRY_LATEST
+from .constants import (
+    DTC_HISTORY,
+    DTC_INSERT,
+    TELEMETRY_INSERT,
+    TELEMETRY_LATEST,
+    TELEMETRY_LATEST_VALUES,
+)
 from .repository import DTCRecord, DataRepository
 
 __all__ = [
@@ -8,6 +14,7 @@ __all__ = [
     "DTCRecord",
     "TELEMETRY_INSERT",
     "TELEMETRY_LATEST",
+    "TELEMETRY_LATEST_VALUES",
     "DTC_INSERT",
     "DTC_HISTORY",
 ]
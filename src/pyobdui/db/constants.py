@@ -1,19 +1,136 @@
 """SQL statements and other database constants."""
 
+SCHEMA_VERSION = 4
+
+# Prepared statements kept by each sqlite3 connection.
+STATEMENT_CACHE_SIZE = 256
+
+# Connection tuning for read-heavy UI queries; lower these on memory-constrained devices.
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+PAGE_CACHE_KIB = 20_000
+
+# Deferred telemetry writes are committed once either threshold is reached.
+MAX_PENDING_WRITES = 10
+MAX_PENDING_SECONDS = 1.0
+
+# Version 1 stored telemetry payloads as TEXT; version 2 stores the encoded bytes as BLOB.
+TELEMETRY_VALUE_BLOB_MIGRATION = """
+BEGIN;
+
+CREATE TABLE telemetry_samples_v2 (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    pid TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    value_json BLOB NOT NULL
+);
+
+INSERT INTO telemetry_samples_v2 (id, pid, recorded_at, value_json)
+SELECT id, pid, recorded_at, CAST(value_json AS BLOB)
+FROM telemetry_samples;
+
+DROP TABLE telemetry_samples;
+
+ALTER TABLE telemetry_samples_v2 RENAME TO telemetry_samples;
+
+CREATE INDEX IF NOT EXISTS idx_telemetry_samples_pid_time
+    ON telemetry_samples (pid, recorded_at DESC);
+
+COMMIT;
+"""
+
+# Version 3 adds projected value columns so latest-value queries can skip value_json.
+TELEMETRY_VALUE_COLUMNS_MIGRATION = """
+BEGIN;
+
+ALTER TABLE telemetry_samples ADD COLUMN value_num REAL;
+ALTER TABLE telemetry_samples ADD COLUMN unit TEXT;
+
+UPDATE telemetry_samples
+SET
+    value_num = CASE
+        WHEN json_type(CAST(value_json AS TEXT), '$.value') IN ('integer', 'real')
+            THEN json_extract(CAST(value_json AS TEXT), '$.value')
+    END,
+    unit = CASE
+        WHEN json_type(CAST(value_json AS TEXT), '$.unit') = 'text'
+            THEN json_extract(CAST(value_json AS TEXT), '$.unit')
+    END;
+
+COMMIT;
+"""
+
+# Version 4 stores DTC detection times as INTEGER Unix seconds instead of ISO-8601 TEXT.
+DTC_EPOCH_MIGRATION = """
+BEGIN;
+
+CREATE TABLE dtc_events_v4 (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    code TEXT NOT NULL,
+    description TEXT,
+    detected_at INTEGER NOT NULL,
+    cleared INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT INTO dtc_events_v4 (id, code, description, detected_at, cleared)
+SELECT id, code, description, CAST(strftime('%s', detected_at) AS INTEGER), cleared
+FROM dtc_events;
+
+DROP TABLE dtc_events;
+
+ALTER TABLE dtc_events_v4 RENAME TO dtc_events;
+
+CREATE INDEX IF NOT EXISTS idx_dtc_events_detected_at
+    ON dtc_events (detected_at DESC);
+
+COMMIT;
+"""
+
 TELEMETRY_INSERT = """
-INSERT INTO telemetry_samples (pid, recorded_at, value_json)
-VALUES (?, ?, ?)
+INSERT INTO telemetry_samples (pid, recorded_at, value_json, value_num, unit)
+VALUES (?, ?, ?, ?, ?)
 """
 
+# Latest sample per PID: walk the distinct PIDs with one index seek each (a loose index scan),
+# then seek the newest row for each PID via idx_telemetry_samples_pid_time.
 TELEMETRY_LATEST = """
+WITH RECURSIVE pids(pid) AS (
+    SELECT MIN(pid) FROM telemetry_samples
+    UNION ALL
+    SELECT (SELECT MIN(pid) FROM telemetry_samples WHERE pid > pids.pid)
+    FROM pids
+    WHERE pids.pid IS NOT NULL
+)
 SELECT ts.pid, ts.recorded_at, ts.value_json
-FROM telemetry_samples AS ts
-JOIN (
-    SELECT pid, MAX(recorded_at) AS recorded_at
-    FROM telemetry_samples
-    GROUP BY pid
-) AS latest
-    ON latest.pid = ts.pid AND latest.recorded_at = ts.recorded_at
+FROM pids
+JOIN telemetry_samples AS ts
+    ON ts.id = (
+        SELECT id
+        FROM telemetry_samples
+        WHERE pid = pids.pid
+        ORDER BY recorded_at DESC, id DESC
+        LIMIT 1
+    )
+ORDER BY ts.pid
+"""
+
+TELEMETRY_LATEST_VALUES = """
+WITH RECURSIVE pids(pid) AS (
+    SELECT MIN(pid) FROM telemetry_samples
+    UNION ALL
+    SELECT (SELECT MIN(pid) FROM telemetry_samples WHERE pid > pids.pid)
+    FROM pids
+    WHERE pids.pid IS NOT NULL
+)
+SELECT ts.pid, ts.recorded_at, ts.value_num
+FROM pids
+JOIN telemetry_samples AS ts
+    ON ts.id = (
+        SELECT id
+        FROM telemetry_samples
+        WHERE pid = pids.pid
+        ORDER BY recorded_at DESC, id DESC
+        LIMIT 1
+    )
 ORDER BY ts.pid
 """
 
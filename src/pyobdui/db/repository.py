@@ -3,15 +3,43 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any, Iterable, Sequence, Tuple
-
-import aiosqlite  # type: ignore[import]
-
-from .constants import DTC_HISTORY, DTC_INSERT, TELEMETRY_INSERT, TELEMETRY_LATEST
+from datetime import date, datetime, time as dt_time, timezone
+from pathlib import Path, PurePath
+from types import ModuleType
+from typing import Any, Callable, Iterable, Sequence, Tuple, TypeVar
+
+from .constants import (
+    DTC_EPOCH_MIGRATION,
+    DTC_HISTORY,
+    DTC_INSERT,
+    MAX_PENDING_SECONDS,
+    MAX_PENDING_WRITES,
+    MMAP_SIZE_BYTES,
+    PAGE_CACHE_KIB,
+    SCHEMA_VERSION,
+    STATEMENT_CACHE_SIZE,
+    TELEMETRY_INSERT,
+    TELEMETRY_LATEST,
+    TELEMETRY_LATEST_VALUES,
+    TELEMETRY_VALUE_BLOB_MIGRATION,
+    TELEMETRY_VALUE_COLUMNS_MIGRATION,
+)
+
+_orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    _orjson = None
+
+_T = TypeVar("_T")
 
 
 @dataclass(slots=True)
@@ -25,90 +53,85 @@ class DTCRecord:
 
 
 class DataRepository:
-    """Persist and retrieve telemetry and diagnostic data using SQLite."""
+    """Persist and retrieve telemetry and diagnostic data using SQLite.
+
+    All database work runs on a single dedicated worker thread that owns the ``sqlite3``
+    connection, so calls are serialized without any additional locking.
+    """
+
+    _logger = logging.getLogger(__name__)
 
     def __init__(self, db_path: Path) -> None:
         self._db_path = db_path
-        self._connection: aiosqlite.Connection | None = None
-        self._lock = asyncio.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._write_cursor: sqlite3.Cursor | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending_writes = 0
+        self._pending_since = 0.0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
 
     async def initialize(self) -> None:
         """Prepare the database connection and ensure schema exists."""
 
-        await self._ensure_connection()
-        assert self._connection is not None  # for type checkers
-
-        await self._connection.execute("PRAGMA journal_mode=WAL;")
-        await self._connection.execute("PRAGMA foreign_keys=ON;")
-        await self._connection.execute("PRAGMA synchronous=NORMAL;")
-
-        await self._connection.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS telemetry_samples (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                pid TEXT NOT NULL,
-                recorded_at TEXT NOT NULL,
-                value_json TEXT NOT NULL
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_telemetry_samples_pid_time
-                ON telemetry_samples (pid, recorded_at DESC);
+        await self._run(self._initialize)
 
-            CREATE TABLE IF NOT EXISTS dtc_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                code TEXT NOT NULL,
-                description TEXT,
-                detected_at TEXT NOT NULL,
-                cleared INTEGER NOT NULL DEFAULT 0
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_dtc_events_detected_at
-                ON dtc_events (detected_at DESC);
-            """
-        )
-
-        await self._connection.commit()
+    async def insert_samples(
+        self,
+        samples: Iterable[dict[str, Any]],
+        *,
+        commit: bool = True,
+    ) -> None:
+        """Insert a batch of sensor samples.
 
-    async def insert_samples(self, samples: Iterable[dict[str, Any]]) -> None:
-        """Insert a batch of sensor samples."""
+        With ``commit=False`` the batch is left in the open transaction and committed together
+        with later batches once ``MAX_PENDING_WRITES`` batches have accumulated, or at the latest
+        ``MAX_PENDING_SECONDS`` after the first deferred batch, or on the next :meth:`flush`.
+        """
 
-        sample_list = list(samples)
-        if not sample_list:
+        iterator = iter(samples)
+        first = next(iterator, None)
+        if first is None:
             return
 
-        await self._ensure_connection()
-        async with self._lock:
-            assert self._connection is not None
-            values = [
-                (
-                    sample.get("pid"),
-                    _ensure_iso_timestamp(sample.get("recorded_at")),
-                    json.dumps(sample, default=str),
-                )
-                for sample in sample_list
-            ]
-
-            await self._connection.executemany(TELEMETRY_INSERT, values)
-            await self._connection.commit()
+        # Rows are streamed into executemany on the worker thread rather than materialized.
+        batch_now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        values = (
+            (
+                sample.get("pid"),
+                _ensure_iso_timestamp(sample.get("recorded_at"), batch_now),
+                _dumps(sample),
+                _numeric_value(sample.get("value")),
+                _unit_value(sample.get("unit")),
+            )
+            for sample in itertools.chain((first,), iterator)
+        )
+        await self._run(self._write, TELEMETRY_INSERT, values, commit)
+        if not commit:
+            self._schedule_flush()
 
     async def fetch_latest_samples(self) -> list[dict[str, Any]]:
         """Fetch the most recent sample for each PID."""
 
-        await self._ensure_connection()
-        async with self._lock:
-            assert self._connection is not None
-            cursor = await self._connection.execute(TELEMETRY_LATEST)
-            rows = await cursor.fetchall()
-            await cursor.close()
+        rows = await self._run(self._fetch, TELEMETRY_LATEST, ())
 
         samples: list[dict[str, Any]] = []
         for row in rows:
-            payload = json.loads(row["value_json"])
+            payload = _loads(row["value_json"])
             payload.setdefault("pid", row["pid"])
             payload.setdefault("recorded_at", row["recorded_at"])
             samples.append(payload)
         return samples
 
+    async def fetch_latest_values(self) -> list[tuple[str, str, float | None]]:
+        """Fetch ``(pid, recorded_at, value_num)`` for the most recent sample of each PID.
+
+        Unlike :meth:`fetch_latest_samples` this never reads or decodes the JSON payload.
+        """
+
+        rows = await self._run(self._fetch, TELEMETRY_LATEST_VALUES, ())
+        return [(row["pid"], row["recorded_at"], row["value_num"]) for row in rows]
+
     async def append_dtc_codes(
         self,
         codes: Sequence[Tuple[str, str | None]],
@@ -120,55 +143,238 @@ class DataRepository:
         if not codes:
             return
 
-        await self._ensure_connection()
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        timestamp = int(time.time())
         rows = [(code, description, timestamp, 1 if cleared else 0) for code, description in codes]
-
-        async with self._lock:
-            assert self._connection is not None
-            await self._connection.executemany(DTC_INSERT, rows)
-            await self._connection.commit()
+        await self._run(self._write, DTC_INSERT, rows, True)
 
     async def fetch_dtc_history(self, *, limit: int = 100) -> list[DTCRecord]:
         """Retrieve stored diagnostic trouble code events."""
 
-        await self._ensure_connection()
-        async with self._lock:
-            assert self._connection is not None
-            cursor = await self._connection.execute(DTC_HISTORY, (limit,))
-            rows = await cursor.fetchall()
-            await cursor.close()
+        rows = await self._run(self._fetch, DTC_HISTORY, (limit,))
 
         return [
             DTCRecord(
                 code=row["code"],
                 description=row["description"],
-                detected_at=datetime.fromisoformat(row["detected_at"]),
+                detected_at=datetime.fromtimestamp(row["detected_at"], tz=timezone.utc),
                 cleared=bool(row["cleared"]),
             )
             for row in rows
         ]
 
+    async def flush(self) -> None:
+        """Commit any telemetry batches deferred with ``commit=False``."""
+
+        if self._executor is None:
+            return
+        await self._run(self._commit, True)
+
     async def close(self) -> None:
-        """Close the underlying connection."""
+        """Commit pending writes, close the connection, and stop the worker thread."""
 
-        if self._connection is not None:
-            await self._connection.close()
+        self._cancel_scheduled_flush()
+        if self._executor is None:
+            return
+        executor = self._executor
+        try:
+            await self._run(self._close)
+        finally:
+            # Drop the handles even if closing failed; they belong to the retiring worker thread
+            # and initialize() must be able to start over on a fresh one.
             self._connection = None
+            self._write_cursor = None
+            self._pending_writes = 0
+            self._executor = None
+            # The close job has already been awaited, so there is nothing to block on here.
+            executor.shutdown(wait=False)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    async def _ensure_connection(self) -> None:
+    def _schedule_flush(self) -> None:
+        # Deferred rows must not wait for a later write that may never come.
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(MAX_PENDING_SECONDS, self._start_scheduled_flush)
+
+    def _start_scheduled_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self._scheduled_flush())
+
+    async def _scheduled_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception:  # pragma: no cover - guard unexpected failures
+            self._logger.exception("Failed to commit deferred telemetry writes")
+
+    def _cancel_scheduled_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    async def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyobdui-db")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    # The methods below run on the worker thread only.
+    def _connect(self) -> sqlite3.Connection:
         if self._connection is None:
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._connection = await aiosqlite.connect(self._db_path)
-            self._connection.row_factory = aiosqlite.Row
+            self._connection = sqlite3.connect(
+                self._db_path, cached_statements=STATEMENT_CACHE_SIZE
+            )
+            self._connection.row_factory = sqlite3.Row
+            # Connection-scoped settings, so they are applied on every connect.
+            self._connection.executescript(
+                f"""
+                PRAGMA mmap_size={MMAP_SIZE_BYTES};
+                PRAGMA cache_size=-{PAGE_CACHE_KIB};
+                PRAGMA temp_store=MEMORY;
+                """
+            )
+            self._write_cursor = self._connection.cursor()
+        return self._connection
 
+    def _initialize(self) -> None:
+        connection = self._connect()
+        connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA foreign_keys=ON;
+            PRAGMA synchronous=NORMAL;
 
-def _ensure_iso_timestamp(value: Any | None) -> str:
-    if isinstance(value, datetime):
-        return value.isoformat(timespec="seconds")
+            CREATE TABLE IF NOT EXISTS telemetry_samples (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                pid TEXT NOT NULL,
+                recorded_at TEXT NOT NULL,
+                value_json BLOB NOT NULL,
+                value_num REAL,
+                unit TEXT
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_telemetry_samples_pid_time
+                ON telemetry_samples (pid, recorded_at DESC);
+
+            CREATE TABLE IF NOT EXISTS dtc_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                code TEXT NOT NULL,
+                description TEXT,
+                detected_at INTEGER NOT NULL,
+                cleared INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_dtc_events_detected_at
+                ON dtc_events (detected_at DESC);
+            """
+        )
+
+        self._migrate(connection)
+        connection.commit()
+
+    def _write(self, statement: str, rows: Iterable[Sequence[Any]], commit: bool) -> None:
+        self._connect()
+        assert self._write_cursor is not None
+        self._write_cursor.executemany(statement, rows)
+        self._commit(commit)
+
+    def _fetch(self, statement: str, parameters: Sequence[Any]) -> list[sqlite3.Row]:
+        return self._connect().execute(statement, parameters).fetchall()
+
+    def _commit(self, force: bool) -> None:
+        if self._connection is None:
+            return
+
+        now = time.monotonic()
+        if not force:
+            if self._pending_writes == 0:
+                self._pending_since = now
+            self._pending_writes += 1
+            if (
+                self._pending_writes < MAX_PENDING_WRITES
+                and now - self._pending_since < MAX_PENDING_SECONDS
+            ):
+                return
+
+        self._connection.commit()
+        self._pending_writes = 0
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._commit(True)
+            if self._write_cursor is not None:
+                self._write_cursor.close()
+                self._write_cursor = None
+            self._connection.close()
+            self._connection = None
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        version = connection.execute("PRAGMA user_version;").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        if version < 2 and _column_type(connection, "telemetry_samples", "value_json") == "TEXT":
+            connection.executescript(TELEMETRY_VALUE_BLOB_MIGRATION)
+
+        if version < 3 and _column_type(connection, "telemetry_samples", "value_num") is None:
+            connection.executescript(TELEMETRY_VALUE_COLUMNS_MIGRATION)
+
+        if version < 4 and _column_type(connection, "dtc_events", "detected_at") == "TEXT":
+            connection.executescript(DTC_EPOCH_MIGRATION)
+
+        connection.execute(f"PRAGMA user_version={SCHEMA_VERSION};")
+
+
+def _column_type(connection: sqlite3.Connection, table: str, column: str) -> str | None:
+    for row in connection.execute(f"PRAGMA table_info({table});"):
+        if row["name"] == column:
+            return str(row["type"]).upper()
+    return None
+
+
+def _numeric_value(value: Any) -> float | None:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _unit_value(value: Any) -> str | None:
     if isinstance(value, str) and value:
         return value
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return None
+
+
+def _ensure_iso_timestamp(value: Any | None, fallback: str) -> str:
+    if isinstance(value, str) and value:
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="seconds")
+    return fallback
+
+
+def _default(value: Any) -> Any:
+    """Encode the non-JSON types samples are known to carry without a generic str() call."""
+
+    if isinstance(value, PurePath):
+        return os.fspath(value)
+    if isinstance(value, (date, dt_time)):
+        # Only reached on the stdlib fallback; orjson serializes these natively.
+        return value.isoformat()
+    # Anything else (e.g. unit quantities) keeps the historical str() representation.
+    return str(value)
+
+
+if _orjson is not None:
+    _orjson_dumps: Callable[..., bytes] = _orjson.dumps
+
+    def _dumps(value: Any) -> bytes:
+        return _orjson_dumps(value, default=_default)
+
+    _loads = _orjson.loads
+else:  # pragma: no cover - exercised only without orjson installed
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, default=_default).encode()
+
+    _loads = json.loads
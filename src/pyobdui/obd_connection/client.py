@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections import deque
+from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar
 
 import obd  # type: ignore[import]
 
 from ..configs import CarConfig
 from ..db import DataRepository
-from .constants import MIN_POLL_INTERVAL
+from .constants import FLUSH_CYCLES, MIN_POLL_INTERVAL, SUBSCRIBER_BUFFER_SIZE
+
+_T = TypeVar("_T")
 
 
 class OBDClientError(RuntimeError):
@@ -23,6 +28,16 @@ class OBDConnectionError(OBDClientError):
     """Raised when a connection to the adapter cannot be established."""
 
 
+class _Subscriber:
+    """Drop-oldest ring buffer plus wake-up event for a single stream consumer."""
+
+    __slots__ = ("buffer", "ready")
+
+    def __init__(self, maxlen: int) -> None:
+        self.buffer: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self.ready = asyncio.Event()
+
+
 class OBDClient:
     """Manage connections to an OBD-II adapter and stream data asynchronously."""
 
@@ -34,10 +49,21 @@ class OBDClient:
 
         self._connection: obd.OBD | None = None
         self._poll_task: asyncio.Task[None] | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._write_buffer: list[dict[str, Any]] = []
+        self._write_ready = asyncio.Event()
         self._stop_event = asyncio.Event()
-        self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
-        self._subscriber_lock = asyncio.Lock()
-        self._missing_pids: set[str] = set()
+        # Copy-on-write: replaced wholesale on (un)subscribe so broadcasts read it without locking.
+        self._subscribers: tuple[_Subscriber, ...] = ()
+        self._command_cache: dict[str, obd.OBDCommand | None] = {}
+        self._pids: tuple[str, ...] = ()
+        self._commands: list[obd.OBDCommand] = []
+        self._last_values: dict[str, tuple[Any, ...]] = {}
+        # Most recent sample per PID, replayed to new subscribers since unchanged PIDs go quiet.
+        self._latest_samples: dict[str, dict[str, Any]] = {}
+        # python-OBD talks to one serial device, so all adapter I/O shares a single worker thread.
+        self._obd_executor: ThreadPoolExecutor | None = None
+        self._stopping = False
 
     async def __aenter__(self) -> "OBDClient":
         await self.start()
@@ -52,15 +78,25 @@ class OBDClient:
         if self._poll_task is not None:
             return
 
+        self._stopping = False
         await self._repository.initialize()
         self._connection = await self._open_connection()
+        self._refresh_commands()
+        self._last_values.clear()
+        self._latest_samples.clear()
         self._stop_event.clear()
+        self._flush_task = asyncio.create_task(self._flush_loop(), name="obd-flush-loop")
         self._poll_task = asyncio.create_task(self._poll_loop(), name="obd-poll-loop")
         self._logger.info("Started OBD polling loop for %s", self._config.name)
 
     async def stop(self) -> None:
-        """Stop polling and close the adapter connection."""
+        """Stop polling and close the adapter connection.
+
+        Adapter requests made after this point raise :class:`OBDClientError` until
+        :meth:`start` is called again; requests already queued still run before the close.
+        """
 
+        self._stopping = True
         if self._poll_task is not None:
             self._stop_event.set()
             try:
@@ -68,32 +104,64 @@ class OBDClient:
             finally:
                 self._poll_task = None
 
+        if self._flush_task is not None:
+            self._write_ready.set()
+            try:
+                await self._flush_task
+            finally:
+                self._flush_task = None
+            try:
+                await self._repository.flush()
+            except Exception:  # pragma: no cover - guard unexpected failures
+                self._logger.exception("Failed to commit telemetry for %s", self._config.name)
+
         if self._connection is not None:
-            await asyncio.to_thread(self._connection.close)
+            await self._submit_io(self._connection.close)
             self._connection = None
             self._logger.info("Closed OBD connection for %s", self._config.name)
 
-    async def stream(self) -> AsyncIterator[dict[str, Any]]:
+        if self._obd_executor is not None:
+            # The close job above has been awaited; never block the event loop on the worker.
+            self._obd_executor.shutdown(wait=False)
+            self._obd_executor = None
+
+    async def stream(self) -> AsyncGenerator[dict[str, Any], None]:
         """Yield samples in real-time for consumers such as the UI."""
 
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=256)
-        async with self._subscriber_lock:
-            self._subscribers.append(queue)
+        async with aclosing(self.stream_batches()) as batches:
+            async for batch in batches:
+                for sample in batch:
+                    yield sample
+
+    async def stream_batches(self) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Yield the samples buffered since the previous batch, typically one poll cycle.
+
+        Sample dictionaries are shared between subscribers and must be treated as read-only.
+        """
+
+        subscriber = _Subscriber(SUBSCRIBER_BUFFER_SIZE)
+        if self._latest_samples:
+            subscriber.buffer.extend(self._latest_samples.values())
+            subscriber.ready.set()
+        self._subscribers = (*self._subscribers, subscriber)
 
         try:
             while True:
-                sample = await queue.get()
-                yield sample
+                await subscriber.ready.wait()
+                subscriber.ready.clear()
+                if not subscriber.buffer:
+                    continue
+                batch = list(subscriber.buffer)
+                subscriber.buffer.clear()
+                yield batch
         finally:
-            async with self._subscriber_lock:
-                if queue in self._subscribers:
-                    self._subscribers.remove(queue)
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscriber)
 
     async def read_dtcs(self, *, persist: bool = True) -> list[tuple[str, str | None]]:
         """Retrieve diagnostic trouble codes from the vehicle."""
 
         connection = await self._ensure_connection()
-        response = await asyncio.to_thread(connection.query, obd.commands.GET_DTC)
+        response = await self._run_io(connection.query, obd.commands.GET_DTC)
         codes: list[tuple[str, str | None]] = []
 
         if response and not response.is_null() and response.value:
@@ -107,19 +175,30 @@ class OBDClient:
         """Clear diagnostic trouble codes from the vehicle."""
 
         connection = await self._ensure_connection()
-        await asyncio.to_thread(connection.query, obd.commands.CLEAR_DTC)
+        await self._run_io(connection.query, obd.commands.CLEAR_DTC)
         self._logger.info("Requested DTC clear for %s", self._config.name)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    async def _run_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        if self._stopping:
+            raise OBDClientError("OBD client is stopping")
+        return await self._submit_io(func, *args)
+
+    async def _submit_io(self, func: Callable[..., _T], *args: Any) -> _T:
+        if self._obd_executor is None:
+            self._obd_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="obd-io")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._obd_executor, func, *args)
+
     async def _open_connection(self) -> obd.OBD:
         self._logger.info("Connecting to adapter on %s", self._config.adapter_port)
 
         def _connect() -> obd.OBD:
             return obd.OBD(portstr=self._config.adapter_port, fast=True)
 
-        connection = await asyncio.to_thread(_connect)
+        connection = await self._run_io(_connect)
         if not connection.is_connected():
             connection.close()
             raise OBDConnectionError(
@@ -136,69 +215,127 @@ class OBDClient:
         assert self._connection is not None
         interval = max(self._config.polling_interval, MIN_POLL_INTERVAL)
 
+        # One long-lived waiter; asyncio.wait() times out without raising each cycle.
+        stop_waiter = asyncio.ensure_future(self._stop_event.wait())
         try:
             while not self._stop_event.is_set():
                 samples = await self._collect_samples()
                 if samples:
-                    await self._repository.insert_samples(samples)
+                    self._write_buffer.extend(samples)
+                    self._write_ready.set()
                     await self._broadcast(samples)
 
-                try:
-                    await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
-                except asyncio.TimeoutError:
-                    continue
+                done, _ = await asyncio.wait({stop_waiter}, timeout=interval)
+                if done:
+                    break
         except Exception:  # pragma: no cover - guard unexpected failures
             self._logger.exception("Unexpected error in OBD polling loop")
         finally:
+            stop_waiter.cancel()
             self._stop_event.set()
+            self._write_ready.set()
+
+    async def _flush_loop(self) -> None:
+        window = max(self._config.polling_interval, MIN_POLL_INTERVAL) * FLUSH_CYCLES
+
+        stop_waiter = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            while not self._stop_event.is_set():
+                await self._write_ready.wait()
+                # Let FLUSH_CYCLES poll cycles land in the same batch; stopping cuts this short.
+                await asyncio.wait({stop_waiter}, timeout=window)
+                self._write_ready.clear()
+                await self._flush_writes()
+        finally:
+            stop_waiter.cancel()
+        await self._flush_writes()
+
+    async def _flush_writes(self) -> None:
+        if not self._write_buffer:
+            return
+
+        batch, self._write_buffer = self._write_buffer, []
+        try:
+            # Commits are coalesced by the repository and forced in stop().
+            await self._repository.insert_samples(batch, commit=False)
+        except Exception:  # pragma: no cover - guard unexpected failures
+            self._logger.exception("Failed to persist %d telemetry samples", len(batch))
+            # Forget the lost readings so unchanged PIDs are emitted and written again.
+            for sample in batch:
+                pid = sample["pid"]
+                if self._last_values.get(pid) == _change_key(sample):
+                    del self._last_values[pid]
 
     async def _collect_samples(self) -> List[dict[str, Any]]:
         connection = await self._ensure_connection()
-        samples: List[dict[str, Any]] = []
+        self._refresh_commands()
+        if not self._commands:
+            return []
 
-        for pid_name in self._config.sorted_pids():
-            command = self._resolve_command(pid_name)
-            if command is None:
-                continue
+        results = await self._run_io(self._query_commands, connection, self._commands)
+        # Every sample from one poll cycle shares the cycle's timestamp.
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        samples: List[dict[str, Any]] = []
+        for command, response in results:
+            sample = self._serialize_response(command, response, timestamp)
+            # Only changes are stored and broadcast.
+            key = _change_key(sample)
+            if self._last_values.get(sample["pid"]) != key:
+                self._last_values[sample["pid"]] = key
+                self._latest_samples[sample["pid"]] = sample
+                samples.append(sample)
+        return samples
 
+    def _query_commands(
+        self, connection: obd.OBD, commands: Sequence[obd.OBDCommand]
+    ) -> List[Tuple[obd.OBDCommand, Any]]:
+        # Runs on the OBD worker thread so a whole poll cycle costs a single hand-off.
+        results: List[Tuple[obd.OBDCommand, Any]] = []
+        for command in commands:
             try:
-                response = await asyncio.to_thread(connection.query, command)
+                results.append((command, connection.query(command)))
             except Exception as exc:  # pragma: no cover - hardware specific failures
-                self._logger.warning("Query for %s failed: %s", pid_name, exc)
-                continue
+                self._logger.warning("Query for %s failed: %s", command.name, exc)
+        return results
+
+    def _refresh_commands(self) -> None:
+        # sorted_pids() returns the config's immutable PID tuple, which is only replaced when
+        # supported_pids is reassigned, so an identity check is enough to notice runtime edits.
+        pids = self._config.sorted_pids()
+        if pids is self._pids:
+            return
 
-            sample = self._serialize_response(command, response)
-            if sample:
-                samples.append(sample)
-        return samples
+        self._pids = pids
+        commands = []
+        for pid_name in pids:
+            command = self._resolve_command(pid_name)
+            if command is not None:
+                commands.append(command)
+        self._commands = commands
+
+    def _resolve_command(self, pid_name: str) -> obd.OBDCommand | None:
+        if pid_name in self._command_cache:
+            return self._command_cache[pid_name]
 
-    def _resolve_command(self, pid_name: str):
         command = getattr(obd.commands, pid_name, None)
-        if command is None and pid_name not in self._missing_pids:
+        if command is None:
             self._logger.warning("Unsupported PID '%s' encountered; skipping", pid_name)
-            self._missing_pids.add(pid_name)
+        self._command_cache[pid_name] = command
         return command
 
-    async def _broadcast(self, samples: Iterable[dict[str, Any]]) -> None:
-        async with self._subscriber_lock:
-            if not self._subscribers:
-                return
-
-            for sample in samples:
-                for queue in self._subscribers:
-                    try:
-                        queue.put_nowait(sample)
-                    except asyncio.QueueFull:
-                        # Drop oldest item to make room, then retry.
-                        try:
-                            queue.get_nowait()
-                            queue.put_nowait(sample)
-                        except asyncio.QueueEmpty:
-                            pass
-
-    def _serialize_response(self, command: obd.OBDCommand, response: Any) -> Dict[str, Any]:
-        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    async def _broadcast(self, samples: Sequence[dict[str, Any]]) -> None:
+        subscribers = self._subscribers
+        if not subscribers:
+            return
 
+        for subscriber in subscribers:
+            # A full deque evicts its oldest samples as the new ones are appended.
+            subscriber.buffer.extend(samples)
+            subscriber.ready.set()
+
+    def _serialize_response(
+        self, command: obd.OBDCommand, response: Any, timestamp: str
+    ) -> Dict[str, Any]:
         sample: Dict[str, Any] = {
             "pid": command.name,
             "description": getattr(command, "description", ""),
@@ -210,30 +347,37 @@ class OBDClient:
             sample["status"] = "no_data"
             return sample
 
-        value = getattr(response, "value", None)
-        sample["raw"] = str(value)
-        sample["unit"] = _extract_unit(value)
-        sample["value"] = _extract_numeric(value)
-        sample["display"] = str(value)
+        text, unit, numeric = _extract_value(getattr(response, "value", None))
+        sample["raw"] = text
+        sample["unit"] = unit
+        sample["value"] = numeric
+        # Pre-format here so the UI can show the string as-is; the unit has its own column.
+        sample["display"] = f"{numeric:.2f}" if numeric is not None and unit else text
 
         return sample
 
 
-def _extract_unit(value: Any) -> str | None:
-    unit = getattr(value, "units", None)
-    if unit:
-        return str(unit)
-    return None
+def _change_key(sample: dict[str, Any]) -> tuple[Any, ...]:
+    # "raw" covers PIDs without a numeric value.
+    return (sample["status"], sample.get("value"), sample.get("raw"))
+
 
+def _extract_value(value: Any) -> tuple[str, str | None, float | None]:
+    """Return ``(text, unit, numeric)`` for a python-OBD response value in a single pass."""
 
-def _extract_numeric(value: Any) -> float | None:
+    text = str(value)
     if value is None:
-        return None
-    if hasattr(value, "magnitude"):
+        return text, None, None
+
+    unit = getattr(value, "units", None)
+    magnitude = getattr(value, "magnitude", None)
+    if magnitude is not None:
         try:
-            return float(getattr(value, "magnitude"))
+            numeric: float | None = float(magnitude)
         except (TypeError, ValueError):
-            return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    return None
+            numeric = None
+    elif isinstance(value, (int, float)):
+        numeric = float(value)
+    else:
+        numeric = None
+    return text, str(unit) if unit else None, numeric
@@ -1,3 +1,7 @@
 """Constants for OBD connection handling."""
 
 MIN_POLL_INTERVAL = 0.1
+# Samples buffered per stream subscriber before the oldest are dropped.
+SUBSCRIBER_BUFFER_SIZE = 256
+# Poll cycles coalesced into one database write; stop() flushes whatever is pending.
+FLUSH_CYCLES = 5
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
+import math
 import sys
-from typing import Any, Iterable, Optional
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Coroutine, Iterable, Optional
 
-from PyQt6 import QtCore, QtWidgets  # type: ignore[import]
+from PyQt6 import QtCore, QtGui, QtWidgets  # type: ignore[import]
 
 from ..db import DataRepository, DTCRecord
 from ..obd_connection import OBDClient
@@ -25,7 +30,15 @@ class MonitoringApp:
     ) -> None:
         self._repository = repository
         self._obd_client = obd_client
-        self._loop = loop or asyncio.get_event_loop()
+        self._loop_thread: Optional[threading.Thread] = None
+        if loop is None:
+            # Nothing else drives a loop for us, so run a private one next to the Qt thread.
+            loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=loop.run_forever, daemon=True, name="asyncio-loop"
+            )
+            self._loop_thread.start()
+        self._loop = loop
 
         self._qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
         self._window = MonitoringWindow(repository, obd_client, self._loop)
@@ -34,7 +47,20 @@ class MonitoringApp:
         """Start the Qt event loop."""
 
         self._window.show()
-        return self._qt_app.exec()
+        try:
+            return self._qt_app.exec()
+        finally:
+            self._stop_loop()
+
+    def _stop_loop(self) -> None:
+        if self._loop_thread is None:
+            return
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+        if not self._loop_thread.is_alive():
+            self._loop.close()
+        self._loop_thread = None
 
 
 class MonitoringWindow(QtWidgets.QMainWindow):
@@ -42,6 +68,15 @@ class MonitoringWindow(QtWidgets.QMainWindow):
 
     _logger = logging.getLogger(__name__)
 
+    # Results are produced on the asyncio thread; signals queue them onto the GUI thread.
+    _telemetry_ready = QtCore.pyqtSignal(list)
+    _telemetry_failed = QtCore.pyqtSignal(str)
+    _dtc_history_ready = QtCore.pyqtSignal(list)
+    _dtc_history_failed = QtCore.pyqtSignal(str)
+    _refresh_all_ready = QtCore.pyqtSignal(tuple)
+    _refresh_all_failed = QtCore.pyqtSignal(str)
+    _samples_ready = QtCore.pyqtSignal(list)
+
     def __init__(
         self,
         repository: DataRepository,
@@ -52,6 +87,18 @@ class MonitoringWindow(QtWidgets.QMainWindow):
         self._repository = repository
         self._obd_client = obd_client
         self._loop = loop
+        self._telemetry_future: Optional[Future[Any]] = None
+        self._dtc_history_future: Optional[Future[Any]] = None
+        self._last_sample_hash: Optional[int] = None
+        self._row_items: dict[str, list[QtWidgets.QTableWidgetItem]] = {}
+        # PIDs in table row order, kept sorted so late arrivals land in place.
+        self._row_order: list[str] = []
+        self._row_recorded_at: dict[str, str] = {}
+        # PIDs delivered by the live stream; unchanged PIDs are not re-sent, so keep their rows.
+        self._streamed_pids: set[str] = set()
+        self._stream_future: Optional[Future[Any]] = None
+        self._dtc_text_cache: dict[tuple[str, datetime, bool, str | None], str] = {}
+        self._dtc_lines: list[str] = []
 
         self.setWindowTitle("pyOBDui - Vehicle Monitor")
         self.resize(960, 600)
@@ -66,7 +113,10 @@ class MonitoringWindow(QtWidgets.QMainWindow):
         self._telemetry_table.setHorizontalHeaderLabels(
             ["PID", "Description", "Value", "Unit", "Status"]
         )
-        self._telemetry_table.horizontalHeader().setStretchLastSection(True)
+        header = self._telemetry_table.horizontalHeader()
+        # Widths are computed when the PID set changes, not on every value update.
+        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
         layout.addWidget(QtWidgets.QLabel("Live Telemetry", self))
         layout.addWidget(self._telemetry_table)
 
@@ -90,83 +140,236 @@ class MonitoringWindow(QtWidgets.QMainWindow):
         # Status bar message
         self.statusBar().showMessage("Ready")
 
-        self._telemetry_timer = QtCore.QTimer(self)
-        self._telemetry_timer.timeout.connect(self._refresh_telemetry)
-        self._telemetry_timer.start(TELEMETRY_REFRESH_MS)
+        self._telemetry_ready.connect(self._on_telemetry_ready)
+        self._telemetry_failed.connect(self._on_telemetry_failed)
+        self._dtc_history_ready.connect(self._populate_dtc_list)
+        self._dtc_history_failed.connect(self._on_dtc_history_failed)
+        self._refresh_all_ready.connect(self._on_refresh_all_ready)
+        self._refresh_all_failed.connect(self._on_refresh_all_failed)
+        self._samples_ready.connect(self._on_samples_ready)
+
+        # One timer drives both refreshes; each fires every N ticks of the shared period.
+        tick_ms = math.gcd(TELEMETRY_REFRESH_MS, DTC_REFRESH_MS)
+        self._telemetry_every = TELEMETRY_REFRESH_MS // tick_ms
+        self._dtc_every = DTC_REFRESH_MS // tick_ms
+        self._tick_count = 0
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.timeout.connect(self._on_refresh_tick)
+        self._refresh_timer.start(tick_ms)
+
+        # Initial fill; afterwards telemetry arrives from the live stream when available.
+        self._refresh_all()
+        self._start_stream()
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._refresh_timer.stop()
+        if self._stream_future is not None:
+            self._stream_future.cancel()
+            self._stream_future = None
+        super().closeEvent(event)
 
-        self._dtc_timer = QtCore.QTimer(self)
-        self._dtc_timer.timeout.connect(self._refresh_dtc_history)
-        self._dtc_timer.start(DTC_REFRESH_MS)
+    # ------------------------------------------------------------------
+    # Combined refresh
+    # ------------------------------------------------------------------
+    def _on_refresh_tick(self) -> None:
+        # While the live stream is up the repository is only polled for DTC history.
+        streaming = _is_pending(self._stream_future)
+        self._tick_count += 1
+        if self._tick_count % self._dtc_every == 0:
+            if streaming:
+                self._refresh_dtc_history()
+            else:
+                self._refresh_all()
+        elif self._tick_count % self._telemetry_every == 0 and not streaming:
+            self._refresh_telemetry()
+
+    def _refresh_all(self) -> None:
+        if _is_pending(self._telemetry_future) or _is_pending(self._dtc_history_future):
+            # Fall back to the individual refreshes, which skip whatever is still in flight.
+            self._refresh_telemetry()
+            self._refresh_dtc_history()
+            return
 
-        # Initial fill
-        self._refresh_telemetry()
-        self._refresh_dtc_history()
+        future = self._submit(self._fetch_all(), self._refresh_all_ready, self._refresh_all_failed)
+        self._telemetry_future = self._dtc_history_future = future
+
+    async def _fetch_all(self) -> tuple[list[dict[str, Any]], list[DTCRecord]]:
+        samples, history = await asyncio.gather(
+            self._repository.fetch_latest_samples(),
+            self._repository.fetch_dtc_history(limit=100),
+        )
+        return samples, history
+
+    def _on_refresh_all_ready(self, results: tuple[list[dict[str, Any]], list[DTCRecord]]) -> None:
+        samples, history = results
+        self._on_telemetry_ready(samples)
+        self._populate_dtc_list(history)
+
+    def _on_refresh_all_failed(self, error: str) -> None:
+        self._logger.warning("Failed to refresh telemetry and DTC history: %s", error)
+        self.statusBar().showMessage("Refresh failed", 3_000)
 
     # ------------------------------------------------------------------
-    # Telemetry
+    # Live stream
     # ------------------------------------------------------------------
-    def _refresh_telemetry(self) -> None:
+    def _start_stream(self) -> None:
+        if self._obd_client is None:
+            return
+
         future = asyncio.run_coroutine_threadsafe(
-            self._repository.fetch_latest_samples(), self._loop
+            self._consume_stream(self._obd_client), self._loop
         )
-        try:
-            samples = future.result(timeout=2)
-        except Exception as exc:  # pragma: no cover - operational guard
-            self._logger.warning("Failed to load telemetry: %s", exc)
-            self.statusBar().showMessage("Telemetry refresh failed", 3_000)
+        future.add_done_callback(self._on_stream_done)
+        self._stream_future = future
+
+    async def _consume_stream(self, obd_client: OBDClient) -> None:
+        async for batch in obd_client.stream_batches():
+            self._samples_ready.emit(batch)
+
+    def _on_stream_done(self, future: Future[Any]) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            # Runs on the asyncio thread; the timer falls back to polling the repository.
+            self._logger.warning("Live telemetry stream stopped: %s", exc)
+
+    def _on_samples_ready(self, batch: list[dict[str, Any]]) -> None:
+        batch_pids = {str(s.get("pid", "")) for s in batch}
+        self._streamed_pids |= batch_pids
+        new_pids = batch_pids - self._row_items.keys()
+        if new_pids:
+            self._sync_rows(self._row_items.keys() | new_pids)
+
+        for sample in batch:
+            self._update_row(sample)
+
+        if new_pids:
+            self._telemetry_table.resizeColumnsToContents()
+        # The table no longer mirrors the last repository snapshot.
+        self._last_sample_hash = None
+
+    # ------------------------------------------------------------------
+    # Telemetry
+    # ------------------------------------------------------------------
+    def _refresh_telemetry(self) -> None:
+        if _is_pending(self._telemetry_future):
             return
 
+        self._telemetry_future = self._submit(
+            self._repository.fetch_latest_samples(),
+            self._telemetry_ready,
+            self._telemetry_failed,
+        )
+
+    def _on_telemetry_ready(self, samples: list[dict[str, Any]]) -> None:
         self._populate_telemetry_table(samples)
         self.statusBar().showMessage("Telemetry updated", 1_500)
 
+    def _on_telemetry_failed(self, error: str) -> None:
+        self._logger.warning("Failed to load telemetry: %s", error)
+        self.statusBar().showMessage("Telemetry refresh failed", 3_000)
+
     def _populate_telemetry_table(self, samples: Iterable[dict[str, Any]]) -> None:
         rows = list(samples)
-        self._telemetry_table.setRowCount(len(rows))
-
-        for row_idx, sample in enumerate(rows):
-            self._set_table_item(row_idx, 0, sample.get("pid", ""))
-            self._set_table_item(row_idx, 1, sample.get("description", ""))
-
-            value = sample.get("display") or sample.get("value", "")
-            if isinstance(value, float):
-                value_text = f"{value:.2f}"
-            else:
-                value_text = str(value)
-            self._set_table_item(row_idx, 2, value_text)
-
-            self._set_table_item(row_idx, 3, sample.get("unit", ""))
-            self._set_table_item(row_idx, 4, sample.get("status", ""))
-
-        self._telemetry_table.resizeColumnsToContents()
+        sample_hash = hash(
+            tuple(
+                (s.get("pid"), s.get("value"), s.get("display"), s.get("status")) for s in rows
+            )
+        )
+        if sample_hash == self._last_sample_hash:
+            return
+        self._last_sample_hash = sample_hash
+
+        pids = {str(sample.get("pid", "")) for sample in rows} | self._streamed_pids
+        resized = pids != self._row_items.keys()
+        if resized:
+            self._sync_rows(pids)
+
+        for sample in rows:
+            self._update_row(sample)
+
+        if resized:
+            self._telemetry_table.resizeColumnsToContents()
+
+    def _sync_rows(self, pids: set[str]) -> None:
+        """Add rows for new PIDs and drop rows for PIDs that are no longer reported."""
+
+        table = self._telemetry_table
+        for pid in [pid for pid in self._row_items if pid not in pids]:
+            row = bisect.bisect_left(self._row_order, pid)
+            table.removeRow(row)
+            del self._row_order[row]
+            del self._row_items[pid]
+            self._row_recorded_at.pop(pid, None)
+            self._streamed_pids.discard(pid)
+
+        for pid in pids - self._row_items.keys():
+            row = bisect.bisect_left(self._row_order, pid)
+            table.insertRow(row)
+            self._row_order.insert(row, pid)
+            items = []
+            for column in range(table.columnCount()):
+                item = QtWidgets.QTableWidgetItem()
+                item.setFlags(item.flags() ^ QtCore.Qt.ItemFlag.ItemIsEditable)
+                table.setItem(row, column, item)
+                items.append(item)
+            items[0].setText(pid)
+            self._row_items[pid] = items
+
+    def _update_row(self, sample: dict[str, Any]) -> None:
+        pid = str(sample.get("pid", ""))
+        # Repository snapshots can lag behind streamed samples; never move a row backwards.
+        recorded_at = str(sample.get("recorded_at") or "")
+        if recorded_at < self._row_recorded_at.get(pid, ""):
+            return
+        self._row_recorded_at[pid] = recorded_at
+        items = self._row_items[pid]
 
-    def _set_table_item(self, row: int, column: int, text: str) -> None:
-        item = QtWidgets.QTableWidgetItem(text)
-        item.setFlags(item.flags() ^ QtCore.Qt.ItemFlag.ItemIsEditable)
-        self._telemetry_table.setItem(row, column, item)
+        items[1].setText(sample.get("description") or "")
+        items[2].setText(str(sample.get("display", "")))
+        items[3].setText(sample.get("unit") or "")
+        items[4].setText(sample.get("status") or "")
 
     # ------------------------------------------------------------------
     # Diagnostics
     # ------------------------------------------------------------------
     def _refresh_dtc_history(self) -> None:
-        future = asyncio.run_coroutine_threadsafe(
-            self._repository.fetch_dtc_history(limit=100), self._loop
-        )
-        try:
-            history = future.result(timeout=2)
-        except Exception as exc:  # pragma: no cover - operational guard
-            self._logger.warning("Failed to load DTC history: %s", exc)
-            self.statusBar().showMessage("Unable to load DTC history", 3_000)
+        if _is_pending(self._dtc_history_future):
             return
 
-        self._populate_dtc_list(history)
+        self._dtc_history_future = self._submit(
+            self._repository.fetch_dtc_history(limit=100),
+            self._dtc_history_ready,
+            self._dtc_history_failed,
+        )
+
+    def _on_dtc_history_failed(self, error: str) -> None:
+        self._logger.warning("Failed to load DTC history: %s", error)
+        self.statusBar().showMessage("Unable to load DTC history", 3_000)
 
     def _populate_dtc_list(self, history: Iterable[DTCRecord]) -> None:
-        self._dtc_list.clear()
+        # History is append-mostly, so most entries were already formatted by a previous refresh.
+        previous = self._dtc_text_cache
+        cache: dict[tuple[str, datetime, bool, str | None], str] = {}
+        lines: list[str] = []
         for record in history:
-            status = "Cleared" if record.cleared else "Active"
-            timestamp = record.detected_at.strftime("%Y-%m-%d %H:%M:%S")
-            description = record.description or ""
-            self._dtc_list.addItem(f"[{status}] {record.code} {description} ({timestamp})")
+            key = (record.code, record.detected_at, record.cleared, record.description)
+            text = cache.get(key) or previous.get(key)
+            if text is None:
+                status = "Cleared" if record.cleared else "Active"
+                timestamp = record.detected_at.strftime("%Y-%m-%d %H:%M:%S")
+                text = f"[{status}] {record.code} {record.description or ''} ({timestamp})"
+            cache[key] = text
+            lines.append(text)
+        self._dtc_text_cache = cache
+
+        if lines == self._dtc_lines:
+            return
+        self._dtc_lines = lines
+        self._dtc_list.clear()
+        self._dtc_list.addItems(lines)
 
     def _on_read_dtcs(self) -> None:
         if self._obd_client is None:
@@ -214,3 +417,31 @@ class MonitoringWindow(QtWidgets.QMainWindow):
 
         QtWidgets.QMessageBox.information(self, "DTCs", "Clear command sent successfully.")
         self._refresh_dtc_history()
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _submit(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        ready: QtCore.pyqtBoundSignal,
+        failed: QtCore.pyqtBoundSignal,
+    ) -> Future[Any]:
+        """Schedule ``coro`` on the asyncio loop and report its outcome via signals."""
+
+        def _deliver(future: Future[Any]) -> None:
+            if future.cancelled():
+                return
+            exc = future.exception()
+            if exc is not None:
+                failed.emit(str(exc))
+            else:
+                ready.emit(future.result())
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(_deliver)
+        return future
+
+
+def _is_pending(future: Optional[Future[Any]]) -> bool:
+    return future is not None and not future.done()